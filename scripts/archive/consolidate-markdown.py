@@ -7,6 +7,9 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+SKIP_DIRS = frozenset({'.git', 'node_modules', 'dist', 'build', '.next'})
+OUTPUT_NAME = 'CONSOLIDATED_DOCUMENTATION.md'
+
 def get_file_size(filepath):
     """Get file size in bytes."""
     try:
@@ -14,90 +17,112 @@ def get_file_size(filepath):
     except:
         return 0
 
-def read_file_content(filepath):
-    """Read file content safely."""
+def copy_file_content(filepath, out, chunk_size=1024 * 1024):
+    """Stream file content into the output file safely."""
+    start = out.tell()
     try:
-        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-            return f.read()
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as src:
+            # Hold back leading whitespace so whitespace-only files count as empty
+            leading = []
+            last = ''
+            for chunk in iter(lambda: src.read(chunk_size), ''):
+                if leading is not None:
+                    if not chunk.strip():
+                        leading.append(chunk)
+                        continue
+                    out.write(''.join(leading))
+                    leading = None
+                out.write(chunk)
+                last = chunk
+        if leading is not None:
+            out.write("*(File is empty)*\n")
+        elif not last.endswith('\n'):
+            out.write('\n')
     except Exception as e:
-        return f"<!-- Error reading file: {e} -->\n"
+        # Drop any partial copy so a failed read only leaves the error comment
+        out.seek(start)
+        out.truncate()
+        out.write(f"<!-- Error reading file: {e} -->\n")
+
+def iter_markdown_files(directory):
+    """Recursively yield markdown file paths, pruning skipped directories."""
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        # Skip unreadable directories, as os.walk does by default
+        return
+    with entries:
+        for entry in entries:
+            # Like os.walk: symlinked dirs are neither files nor descended into
+            if entry.is_dir():
+                if not entry.is_symlink() and entry.name not in SKIP_DIRS:
+                    yield from iter_markdown_files(entry.path)
+            elif entry.name.endswith('.md') and entry.name != OUTPUT_NAME:
+                yield entry.path
 
 def consolidate_markdown_files(root_dir, output_file):
     """Consolidate all markdown files into one."""
     
     # Find all markdown files
-    md_files = []
-    for root, dirs, files in os.walk(root_dir):
-        # Skip certain directories
-        dirs[:] = [d for d in dirs if d not in ['.git', 'node_modules', 'dist', 'build', '.next']]
-        
-        for file in files:
-            if file.endswith('.md') and file != 'CONSOLIDATED_DOCUMENTATION.md':
-                filepath = os.path.join(root, file)
-                rel_path = os.path.relpath(filepath, root_dir)
-                md_files.append((rel_path, filepath))
+    md_files = [
+        (os.path.relpath(filepath, root_dir), filepath)
+        for filepath in iter_markdown_files(root_dir)
+    ]
     
     # Sort by path for consistent ordering
     md_files.sort(key=lambda x: x[0])
+    md_map = dict(md_files)
     
-    # Create consolidated content
-    consolidated = []
-    consolidated.append("# VibeZ Consolidated Documentation\n")
-    consolidated.append(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    consolidated.append(f"**Purpose**: Complete consolidation of all markdown documentation files\n")
-    consolidated.append(f"**Total Files Consolidated**: {len(md_files)}\n")
-    consolidated.append("\n---\n\n")
-    consolidated.append("## Table of Contents\n\n")
-    
-    # Build table of contents
-    toc_sections = {}
-    for rel_path, _ in md_files:
-        # Categorize by directory
-        parts = rel_path.split(os.sep)
-        if len(parts) > 1:
-            category = parts[0]
-        else:
-            category = "Root"
-        
-        if category not in toc_sections:
-            toc_sections[category] = []
-        toc_sections[category].append(rel_path)
-    
-    # Add TOC entries
-    section_num = 1
-    for category in sorted(toc_sections.keys()):
-        consolidated.append(f"{section_num}. [{category}](#{category.lower().replace(' ', '-')})\n")
-        section_num += 1
-    
-    consolidated.append("\n---\n\n")
-    
-    # Add content by category
-    current_category = None
-    for category in sorted(toc_sections.keys()):
-        consolidated.append(f"# {category}\n\n")
+    # Write consolidated content straight to the output file
+    with open(output_file, 'w', encoding='utf-8') as out:
+        out.write("# VibeZ Consolidated Documentation\n")
+        out.write(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        out.write(f"**Purpose**: Complete consolidation of all markdown documentation files\n")
+        out.write(f"**Total Files Consolidated**: {len(md_files)}\n")
+        out.write("\n---\n\n")
+        out.write("## Table of Contents\n\n")
         
-        for rel_path in sorted(toc_sections[category]):
-            _, filepath = next((p, f) for p, f in md_files if p == rel_path)
-            
-            # Add file header
-            consolidated.append(f"## {rel_path}\n\n")
-            consolidated.append(f"**Source**: `{rel_path}`\n\n")
-            consolidated.append("---\n\n")
-            
-            # Read and add content
-            content = read_file_content(filepath)
-            if content.strip():
-                consolidated.append(content)
-                if not content.endswith('\n'):
-                    consolidated.append('\n')
+        # Build table of contents
+        toc_sections = {}
+        for rel_path in md_map:
+            # Categorize by directory
+            parts = rel_path.split(os.sep)
+            if len(parts) > 1:
+                category = parts[0]
             else:
-                consolidated.append("*(File is empty)*\n")
+                category = "Root"
             
-            consolidated.append("\n---\n\n")
-    
-    # Write consolidated file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(''.join(consolidated))
+            if category not in toc_sections:
+                toc_sections[category] = []
+            toc_sections[category].append(rel_path)
+        
+        sorted_categories = sorted(toc_sections.keys())
+        anchors = {c: c.lower().replace(' ', '-') for c in sorted_categories}
+        
+        # Add TOC entries
+        section_num = 1
+        for category in sorted_categories:
+            out.write(f"{section_num}. [{category}](#{anchors[category]})\n")
+            section_num += 1
+        
+        out.write("\n---\n\n")
+        
+        # Add content by category
+        for category in sorted_categories:
+            out.write(f"# {category}\n\n")
+            
+            for rel_path in sorted(toc_sections[category]):
+                filepath = md_map[rel_path]
+                
+                # Add file header
+                out.write(f"## {rel_path}\n\n")
+                out.write(f"**Source**: `{rel_path}`\n\n")
+                out.write("---\n\n")
+                
+                # Stream file content
+                copy_file_content(filepath, out)
+                
+                out.write("\n---\n\n")
     
     print(f"✅ Consolidated {len(md_files)} markdown files into {output_file}")
     print(f"📊 Total size: {get_file_size(output_file) / 1024 / 1024:.2f} MB")
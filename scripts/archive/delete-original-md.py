@@ -5,12 +5,16 @@ Delete original markdown files after consolidation.
 import os
 import re
 
-# Read consolidated file to get list of files that were consolidated
-with open('CONSOLIDATED_DOCUMENTATION.md', 'r') as f:
-    content = f.read()
+SOURCE_RE = re.compile(r'\*\*Source\*\*: `([^`]+)`')
+
+# Stream consolidated file to get list of files that were consolidated
+sources = []
+with open('CONSOLIDATED_DOCUMENTATION.md', 'r', encoding='utf-8', errors='replace') as f:
+    for line in f:
+        match = SOURCE_RE.search(line)
+        if match:
+            sources.append(match.group(1))
 
-# Extract all source file paths
-sources = re.findall(r'\*\*Source\*\*: `([^`]+)`', content)
 print(f'Found {len(sources)} files in consolidated document')
 
 # Delete each file
@@ -19,14 +23,13 @@ not_found = []
 errors = []
 
 for source in sources:
-    if os.path.exists(source):
-        try:
-            os.remove(source)
-            deleted.append(source)
-        except Exception as e:
-            errors.append((source, str(e)))
-    else:
+    try:
+        os.unlink(source)
+        deleted.append(source)
+    except FileNotFoundError:
         not_found.append(source)
+    except Exception as e:
+        errors.append((source, str(e)))
 
 print(f'✅ Deleted {len(deleted)} files')
 print(f'⚠️  {len(not_found)} files not found (may have been already deleted)')
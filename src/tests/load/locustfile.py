@@ -1,5 +1,6 @@
 import random
 import time
+from bisect import bisect_right
 from locust import HttpUser, task, between, LoadTestShape, events
 
 class VibeZUser(HttpUser):
@@ -80,12 +81,14 @@ class WaveShape(LoadTestShape):
         {"duration": 300, "users": 500,  "spawn_rate": 50},   # Stage 5: Cool down (5 mins)
     ]
 
-    def tick(self):
-        run_time = self.get_run_time()
+    # Precomputed once: stage end times (already cumulative) and their tick data
+    _boundaries = [stage["duration"] for stage in stages]
+    _tick_data = [(stage["users"], stage["spawn_rate"]) for stage in stages]
 
-        for stage in self.stages:
-            if run_time < stage["duration"]:
-                tick_data = (stage["users"], stage["spawn_rate"])
-                return tick_data
+    def tick(self):
+        # First stage whose end time is still ahead of run_time
+        i = bisect_right(self._boundaries, self.get_run_time())
+        if i < len(self._tick_data):
+            return self._tick_data[i]
 
         return None